@@ -1,161 +1,654 @@
-import csv
-import statistics
-
-
-class Preference:
-    def __init__(self, level):
-        self.level = level
-
-
-class Agency:
-    def __init__(self, name):
-        self.name = name
-        self.fbwmPartner = None  # NFB, FBNE or FBE
-        self.deliveredPerWk = 0  # meals delivered per week by RT in 2023
-        self.servedPerWk = 0  # meals served per week in 2023
-        self.entitlement = 0  # will be calculated as servedPerWk - deliveredPerWk
-        self.fridgeCount = None
-        self.freezerCount = None
-        self.foodTypeData = {}  # dictionary to store food type percentages
-
-        self.city = None
-        self.state = None
-        self.address = None
-        self.zip = None
-        self.latitude = None
-        self.longitude = None
-
-
-# reads agency data from CSV file with median fallback for invalid MD/MS values
-def readAgencyData(agencyDataPath):
-    agencies = []
-
-    try:
-        # first pass: collect all rows and identify valid MD/MS values
-        validMdValues = []
-        validMsValues = []
-        rowData = []
-
-        with open(agencyDataPath, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-
-            for row in reader:
-                # skip empty rows
-                if not row.get("Name") or not row["Name"].strip():
-                    continue
-
-                rowData.append(row)
-
-                # collect valid MD values
-                if row.get("MD"):
-                    try:
-                        mdValue = float(row["MD"])
-                        validMdValues.append(mdValue)
-                    except (ValueError, TypeError):
-                        pass  # skip invalid values for median calculation
-
-                # collect valid MS values
-                if row.get("MS"):
-                    try:
-                        msValue = float(row["MS"])
-                        validMsValues.append(msValue)
-                    except (ValueError, TypeError):
-                        pass  # skip invalid values for median calculation
-
-        # calculate median values
-        medianMd = statistics.median(validMdValues) if validMdValues else 0.0
-        medianMs = statistics.median(validMsValues) if validMsValues else 0.0
-
-        # second pass: create agency objects and assign values
-        for row in rowData:
-            # create agency object
-            agency = Agency(row["Name"].strip())
-
-            # populate location data
-            if row.get("Address"):
-                agency.address = row["Address"].strip()
-
-            if row.get("City"):
-                agency.city = row["City"].strip()
-
-            if row.get("State"):
-                agency.state = row["State"].strip()
-
-            if row.get("Zip"):
-                agency.zip = row["Zip"].strip()
-
-            # populate coordinates
-            if row.get("Latitude"):
-                try:
-                    agency.latitude = float(row["Latitude"])
-                except (ValueError, TypeError):
-                    agency.latitude = None
-
-            if row.get("Longitude"):
-                try:
-                    agency.longitude = float(row["Longitude"])
-                except (ValueError, TypeError):
-                    agency.longitude = None
-
-            # populate FBWM partnership status
-            if row.get("FBWM"):
-                fbwmStr = row["FBWM"].strip().upper()
-                if fbwmStr == "NFB":
-                    agency.fbwmPartner = False
-                elif fbwmStr in ["FBE", "FBNE"]:
-                    agency.fbwmPartner = fbwmStr
-                else:
-                    agency.fbwmPartner = None
-
-            # populate storage capacity
-            if row.get("Fridge"):
-                try:
-                    agency.fridgeCount = int(row["Fridge"])
-                except (ValueError, TypeError):
-                    agency.fridgeCount = None
-
-            if row.get("Freezer"):
-                try:
-                    agency.freezerCount = int(row["Freezer"])
-                except (ValueError, TypeError):
-                    agency.freezerCount = None
-
-            # populate meals data with median fallback
-            if row.get("MS"):
-                try:
-                    agency.servedPerWk = float(row["MS"])
-                except (ValueError, TypeError):
-                    agency.servedPerWk = medianMs
-                    print(f"Using median MS ({medianMs}) for agency {agency.name}")
-            else:
-                agency.servedPerWk = medianMs
-                print(
-                    f"No MS data, using median MS ({medianMs}) for agency {agency.name}"
-                )
-
-            if row.get("MD"):
-                try:
-                    agency.deliveredPerWk = float(row["MD"])
-                except (ValueError, TypeError):
-                    agency.deliveredPerWk = medianMd
-                    print(f"Using median MD ({medianMd}) for agency {agency.name}")
-            else:
-                agency.deliveredPerWk = medianMd
-                print(
-                    f"No MD data, using median MD ({medianMd}) for agency {agency.name}"
-                )
-
-            # calculate entitlement
-            agency.entitlement = agency.servedPerWk - agency.deliveredPerWk
-
-            agencies.append(agency)
-
-        print(f"Successfully loaded {len(agencies)} agencies from {agencyDataPath}")
-        return agencies
-
-    except FileNotFoundError:
-        print(f"Error: File not found: {agencyDataPath}")
-        return []
-    except Exception as e:
-        print(f"Error reading agency data: {str(e)}")
-        return []
+import os
+import pickle
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from numba import njit
+from rapidfuzz import fuzz, process
+
+# compiled once at import; these run once per candidate name in the
+# fuzzy-matching loops below, so per-call re.compile lookups add up
+_WS_RE = re.compile(r"\s+")
+_TRAIL_PUNCT_RE = re.compile(r"[,\.]*$")
+_EXTRACT_TRAIL_RE = re.compile(r"[,\s]*$")
+_HOUR_RE = re.compile(
+    r"(\d{1,2}(?::\d{2})?)\s*([ap]m?)?\s*[-–]\s*(\d{1,2}(?::\d{2})?)\s*([ap]m?)?",
+    re.IGNORECASE,
+)
+_COUNT_FRIDGE_RE = re.compile(r"(\d+)[^\d\n]*fridge", re.IGNORECASE)
+_COUNT_FREEZER_RE = re.compile(r"(\d+)[^\d\n]*freezer", re.IGNORECASE)
+
+# FBWM column values mapped to fbwmPartner in one vectorized pass
+_FBWM_MAP = {"NFB": False, "FBE": "FBE", "FBNE": "FBNE"}
+
+# fixed food type column order from the equity workbook, so per-agency food
+# type data can live in one contiguous matrix instead of a dict per agency.
+# spellings must match the sheet headers exactly, including the workbook's
+# "Cleaning/ Hygeine" typo, since foodTypeData is keyed on the raw headers
+FOOD_TYPE_COLUMNS = (
+    "Bread & Bakery",
+    "Dairy & Eggs",
+    "Prepared Foods",
+    "Non-perishables",
+    "Produce",
+    "Meat & Protein",
+    "Cleaning/ Hygeine",
+)
+FOOD_TYPE_INDEX = {name: i for i, name in enumerate(FOOD_TYPE_COLUMNS)}
+
+# common spelling variations collapsed before fuzzy matching:
+# single characters go through one C-level translate pass, multi-character
+# forms through one alternation regex (ordered so " inc." wins over " inc")
+_CHAR_TRANSLATION = str.maketrans({"&": "and", "'": "", "-": " "})
+_WORD_REPLACEMENTS = {"saint ": "st ", " inc.": "", " inc": ""}
+_WORD_RE = re.compile("|".join(re.escape(word) for word in _WORD_REPLACEMENTS))
+
+
+class Preference:
+    __slots__ = ("level",)
+
+    def __init__(self, level):
+        self.level = level
+
+
+class Agency:
+    # fixed attribute layout: no per-instance __dict__, so each agency is a
+    # few pointers instead of a hash table (one Agency is created per CSV row)
+    __slots__ = (
+        "name",
+        "fbwmPartner",
+        "deliveredPerWk",
+        "servedPerWk",
+        "entitlement",
+        "fridgeCount",
+        "freezerCount",
+        "foodTypeData",
+        "city",
+        "state",
+        "address",
+        "zip",
+        "latitude",
+        "longitude",
+        "receivingHours",
+    )
+
+    def __init__(self, name):
+        self.name = name
+        self.fbwmPartner = None  # NFB, FBNE or FBE
+        self.deliveredPerWk = 0  # meals delivered per week by RT in 2023
+        self.servedPerWk = 0  # meals served per week in 2023
+        self.entitlement = 0  # will be calculated as servedPerWk - deliveredPerWk
+        self.fridgeCount = None
+        self.freezerCount = None
+        self.foodTypeData = {}  # dictionary to store food type percentages
+
+        self.city = None
+        self.state = None
+        self.address = None
+        self.zip = None
+        self.latitude = None
+        self.longitude = None
+        self.receivingHours = []  # list of (start, end) hour tuples
+
+
+# identifies a set of source files by mtime and size, so the ingest cache
+# is invalidated whenever a source changes
+def _cacheSignature(*paths):
+    return tuple((os.path.getmtime(path), os.path.getsize(path)) for path in paths)
+
+
+# returns the cached agency list if the signature still matches, else None
+def _loadAgencyCache(cachePath, signature):
+    try:
+        with open(cachePath, "rb") as f:
+            cached = pickle.load(f)
+        if cached["signature"] == signature:
+            return cached["agencies"]
+    except (OSError, pickle.PickleError, KeyError, EOFError):
+        pass
+    return None
+
+
+# writes the parsed agency list next to the source data; a failed write
+# just means the next run re-parses
+def _saveAgencyCache(cachePath, signature, agencies):
+    try:
+        with open(cachePath, "wb") as f:
+            pickle.dump({"signature": signature, "agencies": agencies}, f, protocol=5)
+    except OSError:
+        pass
+
+
+# fills missing MS/MD with the medians and computes entitlement in one pass
+# compiled with numba; cache=True avoids recompiling on every run
+@njit(cache=True)
+def _fillAndEntitle(ms, md, medianMs, medianMd):
+    n = ms.shape[0]
+    entitlement = np.empty(n)
+
+    for i in range(n):
+        served = medianMs if np.isnan(ms[i]) else ms[i]
+        delivered = medianMd if np.isnan(md[i]) else md[i]
+        ms[i] = served
+        md[i] = delivered
+        entitlement[i] = served - delivered
+
+    return entitlement
+
+
+# loads the agency CSV into a cleaned, numerically typed DataFrame
+def _loadAgencyFrame(agencyDataPath):
+    # parse the CSV in C; numeric coercion is done column-wise below
+    df = pd.read_csv(
+        agencyDataPath,
+        dtype={
+            "Name": str,
+            "Address": str,
+            "City": str,
+            "State": str,
+            "Zip": str,
+            "FBWM": str,
+        },
+    )
+
+    # strip names once column-wise, then drop empty rows
+    df["Name"] = df["Name"].str.strip()
+    df = df[df["Name"].notna() & (df["Name"] != "")]
+
+    # coerce numeric columns in one vectorized pass instead of per-row try/except
+    for column in ("Latitude", "Longitude", "Fridge", "Freezer", "MS", "MD"):
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], errors="coerce")
+        else:
+            df[column] = float("nan")
+
+    # nullable ints so missing storage counts stay distinguishable;
+    # fractional counts (e.g. "0.5") are treated as invalid, as before
+    for column in ("Fridge", "Freezer"):
+        counts = df[column]
+        df[column] = counts.where(counts % 1 == 0).astype("Int64")
+
+    # parse FBWM column-wise: one strip/upper/map pass instead of per-row branches
+    if "FBWM" in df.columns:
+        df["FBWM"] = df["FBWM"].str.strip().str.upper().map(_FBWM_MAP)
+    else:
+        df["FBWM"] = None
+
+    # median fallback for missing MD/MS, computed and applied column-wise
+    medianMs = df["MS"].median()
+    medianMd = df["MD"].median()
+    medianMs = 0.0 if pd.isna(medianMs) else medianMs
+    medianMd = 0.0 if pd.isna(medianMd) else medianMd
+
+    missingMs = df["MS"].isna()
+    missingMd = df["MD"].isna()
+
+    # fill both columns and compute entitlement in a single fused pass
+    msValues = df["MS"].to_numpy(dtype=np.float64, copy=True)
+    mdValues = df["MD"].to_numpy(dtype=np.float64, copy=True)
+    df["entitlement"] = _fillAndEntitle(msValues, mdValues, medianMs, medianMd)
+    df["MS"] = msValues
+    df["MD"] = mdValues
+
+    # report fallbacks once instead of printing per row
+    if missingMs.any():
+        print(
+            f"Applied median MS ({medianMs}) to {missingMs.sum()} agencies: "
+            f"{', '.join(df.loc[missingMs, 'Name'])}"
+        )
+    if missingMd.any():
+        print(
+            f"Applied median MD ({medianMd}) to {missingMd.sum()} agencies: "
+            f"{', '.join(df.loc[missingMd, 'Name'])}"
+        )
+
+    return df
+
+
+# reads agency data from CSV file with median fallback for invalid MD/MS values
+def readAgencyData(agencyDataPath):
+    agencies = []
+
+    try:
+        # reuse the parsed result from the last run if the file is unchanged
+        signature = _cacheSignature(agencyDataPath)
+        cachePath = agencyDataPath + ".cache.pkl"
+        cached = _loadAgencyCache(cachePath, signature)
+        if cached is not None:
+            print(f"Loaded {len(cached)} agencies from cache for {agencyDataPath}")
+            return cached
+
+        df = _loadAgencyFrame(agencyDataPath)
+
+        # single pass over plain tuples to create agency objects
+        for row in df.itertuples(index=False):
+            agency = Agency(row.Name)
+
+            # populate location data
+            if pd.notna(row.Address):
+                agency.address = row.Address.strip()
+
+            if pd.notna(row.City):
+                agency.city = row.City.strip()
+
+            if pd.notna(row.State):
+                agency.state = row.State.strip()
+
+            if pd.notna(row.Zip):
+                agency.zip = row.Zip.strip()
+
+            # populate coordinates
+            if pd.notna(row.Latitude):
+                agency.latitude = float(row.Latitude)
+
+            if pd.notna(row.Longitude):
+                agency.longitude = float(row.Longitude)
+
+            # FBWM partnership status was mapped column-wise above
+            if pd.notna(row.FBWM):
+                agency.fbwmPartner = row.FBWM
+
+            # populate storage capacity
+            if pd.notna(row.Fridge):
+                agency.fridgeCount = int(row.Fridge)
+
+            if pd.notna(row.Freezer):
+                agency.freezerCount = int(row.Freezer)
+
+            # meals data already has the median fallback applied column-wise
+            agency.servedPerWk = float(row.MS)
+            agency.deliveredPerWk = float(row.MD)
+            agency.entitlement = float(row.entitlement)
+
+            agencies.append(agency)
+
+        print(f"Successfully loaded {len(agencies)} agencies from {agencyDataPath}")
+        _saveAgencyCache(cachePath, signature, agencies)
+        return agencies
+
+    except FileNotFoundError:
+        print(f"Error: File not found: {agencyDataPath}")
+        return []
+    except Exception as e:
+        print(f"Error reading agency data: {str(e)}")
+        return []
+
+
+# columnar (structure-of-arrays) view of the agency data: one NumPy array
+# per field, so downstream numeric passes vectorize instead of chasing one
+# Agency object per row
+@dataclass
+class AgencyTable:
+    name: np.ndarray
+    latitude: np.ndarray
+    longitude: np.ndarray
+    servedPerWk: np.ndarray
+    deliveredPerWk: np.ndarray
+    entitlement: np.ndarray
+    fbwmPartner: np.ndarray
+    # (N, len(FOOD_TYPE_COLUMNS)) float32 matrix indexed via FOOD_TYPE_INDEX;
+    # None when the source has no food type data
+    foodType: np.ndarray = None
+
+    def __len__(self):
+        return len(self.name)
+
+    # materializes one row as an Agency object for object-style callers
+    def view(self, i):
+        agency = Agency(str(self.name[i]))
+        agency.servedPerWk = float(self.servedPerWk[i])
+        agency.deliveredPerWk = float(self.deliveredPerWk[i])
+        agency.entitlement = float(self.entitlement[i])
+        agency.fbwmPartner = self.fbwmPartner[i]
+
+        if not np.isnan(self.latitude[i]):
+            agency.latitude = float(self.latitude[i])
+        if not np.isnan(self.longitude[i]):
+            agency.longitude = float(self.longitude[i])
+
+        return agency
+
+
+# packs per-agency foodTypeData dicts into one contiguous float32 matrix,
+# one row per agency, columns in FOOD_TYPE_COLUMNS order
+def buildFoodTypeMatrix(agencies):
+    matrix = np.full(
+        (len(agencies), len(FOOD_TYPE_COLUMNS)), np.nan, dtype=np.float32
+    )
+
+    for i, agency in enumerate(agencies):
+        for name, value in agency.foodTypeData.items():
+            j = FOOD_TYPE_INDEX.get(name)
+            if j is not None:
+                matrix[i, j] = value
+
+    return matrix
+
+
+# reads agency data from CSV into columnar arrays instead of objects
+def readAgencyTable(agencyDataPath):
+    try:
+        df = _loadAgencyFrame(agencyDataPath)
+
+        # float32 halves the footprint of the numeric columns; weekly meal
+        # counts and lat/lon fit comfortably in single precision
+        table = AgencyTable(
+            name=df["Name"].to_numpy(),
+            latitude=df["Latitude"].to_numpy(np.float32),
+            longitude=df["Longitude"].to_numpy(np.float32),
+            servedPerWk=df["MS"].to_numpy(np.float32),
+            deliveredPerWk=df["MD"].to_numpy(np.float32),
+            entitlement=df["entitlement"].to_numpy(np.float32),
+            fbwmPartner=df["FBWM"].to_numpy(object),
+        )
+
+        print(f"Successfully loaded {len(table)} agencies from {agencyDataPath}")
+        return table
+
+    except FileNotFoundError:
+        print(f"Error: File not found: {agencyDataPath}")
+        return None
+    except Exception as e:
+        print(f"Error reading agency data: {str(e)}")
+        return None
+
+
+# normalizes an agency name for fuzzy comparison
+# cached because findBestMatch re-normalizes the same candidate names for
+# every equity row it tries to match
+@lru_cache(maxsize=None)
+def normalizeAgencyName(name):
+    normalized = name.lower().strip()
+
+    # collapse common spelling variations in two scans instead of one per pair
+    normalized = normalized.translate(_CHAR_TRANSLATION)
+    normalized = _WORD_RE.sub(lambda match: _WORD_REPLACEMENTS[match.group(0)], normalized)
+
+    # drop trailing punctuation and squeeze whitespace
+    normalized = _TRAIL_PUNCT_RE.sub("", normalized)
+    normalized = _WS_RE.sub(" ", normalized)
+
+    return normalized.strip()
+
+
+# pulls the agency name out of a combined name/address cell
+def extractAgencyName(cellText):
+    # the name is the first line; the address follows on later lines
+    name = cellText.split("\n", 1)[0]
+    return _EXTRACT_TRAIL_RE.sub("", name).strip()
+
+
+# parses hour ranges like "9 am - 5 pm" out of a schedule cell
+def parseHours(cellText):
+    hours = []
+
+    for match in _HOUR_RE.finditer(cellText):
+        startStr, startPeriod, endStr, endPeriod = match.groups()
+
+        start = float(startStr.replace(":", "."))
+        end = float(endStr.replace(":", "."))
+
+        # apply am/pm, assuming pm when the end period says so
+        if startPeriod and startPeriod.lower().startswith("p") and start < 12:
+            start += 12
+        if endPeriod and endPeriod.lower().startswith("p") and end < 12:
+            end += 12
+
+        hours.append((start, end))
+
+    return hours
+
+
+# maps each word token to the candidate names containing it, so fuzzy
+# matching only scores candidates sharing at least one token with the target
+@lru_cache(maxsize=None)
+def _buildTokenIndex(candidateNames):
+    tokenIndex = defaultdict(list)
+
+    for candidate in candidateNames:
+        for token in normalizeAgencyName(candidate).split():
+            tokenIndex[token].append(candidate)
+
+    return tokenIndex
+
+
+# finds the closest agency name using fuzzy string matching
+def findBestMatch(targetName, candidateNames, threshold=0.6):
+    candidateNames = tuple(candidateNames)
+    normalizedTarget = normalizeAgencyName(targetName)
+
+    # prune to candidates sharing a word token; fall back to the full list
+    # so targets with no token overlap still get the old full scan
+    tokenIndex = _buildTokenIndex(candidateNames)
+    candidates = {
+        candidate
+        for token in normalizedTarget.split()
+        for candidate in tokenIndex.get(token, ())
+    }
+    if not candidates:
+        candidates = candidateNames
+
+    # map normalized forms back to the original candidate names
+    choicesNormalized = {
+        normalizeAgencyName(candidate): candidate for candidate in candidates
+    }
+
+    # rapidfuzz scores all candidates in one C call instead of a Python loop
+    result = process.extractOne(
+        normalizedTarget,
+        choicesNormalized.keys(),
+        scorer=fuzz.ratio,
+        score_cutoff=threshold * 100,
+    )
+
+    if result is None:
+        return None, 0.0
+    return choicesNormalized[result[0]], result[1] / 100.0
+
+
+# counts fridges/freezers described in an equipment cell
+def _countEquipment(cellText, pattern):
+    counts = [int(m.group(1)) for m in pattern.finditer(cellText)]
+    return sum(counts) if counts else None
+
+
+# reads agency data from the current agency list and equity summary workbooks
+def readAgencyDataXlsx(agencyListPath, equityDataPath=None):
+    agencies = []
+
+    try:
+        # reuse the parsed result from the last run if the workbooks are unchanged
+        sourcePaths = [agencyListPath]
+        if equityDataPath is not None:
+            sourcePaths.append(equityDataPath)
+        signature = _cacheSignature(*sourcePaths)
+        cachePath = agencyListPath + ".cache.pkl"
+        cached = _loadAgencyCache(cachePath, signature)
+        if cached is not None:
+            print(f"Loaded {len(cached)} agencies from cache for {agencyListPath}")
+            return cached
+
+        # read all needed sheets concurrently; openpyxl's XML parsing
+        # releases the GIL, so the three reads overlap on multicore machines.
+        # sheet 0 is the current agency list; only the columns the loops
+        # below actually read are parsed
+        poundsDf = foodTypeDf = None
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            currentFuture = executor.submit(
+                pd.read_excel, agencyListPath, sheet_name=0, usecols="A:J"
+            )
+            if equityDataPath is not None:
+                poundsFuture = executor.submit(
+                    pd.read_excel,
+                    equityDataPath,
+                    sheet_name="Pounds Data Analysis",
+                    usecols="A:G",
+                )
+                foodTypeFuture = executor.submit(
+                    pd.read_excel,
+                    equityDataPath,
+                    sheet_name="Food Type Data Analysis",
+                    # the sheet runs through column O ("Cleaning/ Hygeine")
+                    usecols="A:O",
+                )
+                poundsDf = poundsFuture.result()
+                foodTypeDf = foodTypeFuture.result()
+            currentAgencyDf = currentFuture.result()
+
+        for row in currentAgencyDf.itertuples(index=False, name=None):
+            # skip rows without a name/address cell; fetch and strip once
+            nameCell = "" if pd.isna(row[0]) else str(row[0]).strip()
+            if not nameCell:
+                continue
+
+            agency = Agency(extractAgencyName(nameCell))
+
+            # city and FB partnership status
+            if not pd.isna(row[1]):
+                agency.city = str(row[1]).split("\n")[0].strip()
+
+            if not pd.isna(row[9]):
+                fbStr = str(row[9]).strip().upper()
+                agency.fbwmPartner = "FBE" if fbStr.startswith("Y") else False
+
+            # receiving hours and storage capacity from free-text cells
+            if not pd.isna(row[3]):
+                agency.receivingHours = parseHours(str(row[3]))
+
+            if not pd.isna(row[4]):
+                equipment = str(row[4])
+                agency.fridgeCount = _countEquipment(equipment, _COUNT_FRIDGE_RE)
+                agency.freezerCount = _countEquipment(equipment, _COUNT_FREEZER_RE)
+
+            agencies.append(agency)
+
+        print(f"Successfully loaded {len(agencies)} agencies from {agencyListPath}")
+
+        if equityDataPath is not None:
+            _mergeEquityData(agencies, equityDataPath, poundsDf, foodTypeDf)
+
+        _saveAgencyCache(cachePath, signature, agencies)
+        return agencies
+
+    except FileNotFoundError:
+        print(f"Error: File not found: {agencyListPath}")
+        return []
+    except Exception as e:
+        print(f"Error reading agency list: {str(e)}")
+        return []
+
+
+# fuzzy-matches a batch of names against the candidates in one multithreaded
+# cdist call; returns one (match, score) pair per target, None below threshold
+def _batchBestMatches(targetNames, candidateNames, threshold=0.6):
+    if not targetNames:
+        return []
+
+    normalizedTargets = [normalizeAgencyName(name) for name in targetNames]
+    normalizedCandidates = [normalizeAgencyName(name) for name in candidateNames]
+
+    scores = process.cdist(
+        normalizedTargets, normalizedCandidates, scorer=fuzz.ratio, workers=-1
+    )
+    best = scores.argmax(axis=1)
+    bestScores = scores.max(axis=1)
+
+    return [
+        (
+            (candidateNames[best[i]], bestScores[i] / 100.0)
+            if bestScores[i] >= threshold * 100
+            else (None, 0.0)
+        )
+        for i in range(len(targetNames))
+    ]
+
+
+# merges meals and food type data from the pre-read equity summary sheets
+def _mergeEquityData(agencies, equityDataPath, poundsDf, foodTypeDf):
+    agencyByName = {agency.name: agency for agency in agencies}
+    agencyNames = list(agencyByName.keys())
+
+    equityAgencyNames = []
+
+    # pounds sheet: meals served and delivered per week per agency
+    # collect the data rows, then match all names in one cdist call
+    poundsRows = []
+    for row in poundsDf.itertuples(index=False, name=None):
+        # skip section headers and note rows (no numeric meals data)
+        if pd.isna(row[0]) or pd.isna(row[5]):
+            continue
+
+        equityName = str(row[0]).strip()
+        equityAgencyNames.append(equityName)
+        poundsRows.append((equityName, row[5], row[6]))
+
+    matches = _batchBestMatches([r[0] for r in poundsRows], agencyNames)
+
+    matched = 0
+    for (equityName, served, delivered), (match, score) in zip(poundsRows, matches):
+        if match is None:
+            continue
+
+        agency = agencyByName[match]
+        agency.servedPerWk = float(served)
+        if not pd.isna(delivered):
+            agency.deliveredPerWk = float(delivered)
+        agency.entitlement = agency.servedPerWk - agency.deliveredPerWk
+        matched += 1
+
+    print(f"Matched meals data for {matched} agencies from {equityDataPath}")
+
+    # food type sheet: per-agency food type fractions
+    foodTypeColumns = [
+        (i, column)
+        for i, column in enumerate(foodTypeDf.columns)
+        if "Z-Score" not in str(column) and i >= 2
+    ]
+
+    foodTypeRows = []
+    for row in foodTypeDf.itertuples(index=False, name=None):
+        if pd.isna(row[1]):
+            continue
+
+        equityName = str(row[1]).strip()
+        equityAgencyNames.append(equityName)
+        foodTypeRows.append((equityName, row))
+
+    matches = _batchBestMatches([r[0] for r in foodTypeRows], agencyNames)
+
+    matched = 0
+    for (equityName, row), (match, score) in zip(foodTypeRows, matches):
+        if match is None:
+            continue
+
+        agency = agencyByName[match]
+        for i, column in foodTypeColumns:
+            if not pd.isna(row[i]):
+                agency.foodTypeData[str(column)] = float(row[i])
+        matched += 1
+
+    print(f"Matched food type data for {matched} agencies")
+
+    # report current agencies that never appear in the equity workbook:
+    # exact normalized lookup first, then one fuzzy probe for near matches
+    equitySet = {normalizeAgencyName(name) for name in equityAgencyNames}
+    equityNames = tuple(equityAgencyNames)
+
+    missingAgencies = []
+    for agencyName in agencyNames:
+        if normalizeAgencyName(agencyName) in equitySet:
+            continue
+        match, score = findBestMatch(agencyName, equityNames)
+        if match is None:
+            missingAgencies.append(agencyName)
+
+    if missingAgencies:
+        print(
+            f"Warning: no equity data found for {len(missingAgencies)} agencies: "
+            f"{', '.join(missingAgencies)}"
+        )
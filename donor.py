@@ -1,4 +1,26 @@
 import csv
+import os
+import pickle
+
+# numeric CSV columns and the Donor attributes they populate
+_FLOAT_FIELDS = (
+    ("Latitude", "latitude"),
+    ("Longitude", "longitude"),
+    ("Bread%", "breadPercent"),
+    ("Dairy%", "dairyPercent"),
+    ("Prepared%", "preparedPercent"),
+    ("Non-Perishable%", "nonPerishablePercent"),
+    ("Produce%", "producePercent"),
+    ("Protein%", "proteinPercent"),
+    ("Hygiene%", "hygienePercent"),
+)
+
+_TEXT_FIELDS = (
+    ("Address", "address"),
+    ("City", "city"),
+    ("State", "state"),
+    ("Zip", "zip"),
+)
 
 
 class Donor:
@@ -23,27 +45,83 @@ class Donor:
         self.hygienePercent = None
 
 
+# cheap change signature for the cache: (mtime, size) of the source file
+def _cacheSignature(path):
+    return (os.path.getmtime(path), os.path.getsize(path))
+
+
+# returns the cached donor list if the source file is unchanged, else None
+# (same mtime/size signature scheme as the agency cache)
+def _loadDonorCache(cachePath, signature):
+    try:
+        with open(cachePath, "rb") as f:
+            cached = pickle.load(f)
+        if cached["signature"] == signature:
+            return cached["donors"]
+    except (OSError, pickle.PickleError, KeyError, EOFError):
+        pass
+    return None
+
+
+# writes the parsed donor list next to the source data; a failed write
+# just means the next run re-parses
+def _saveDonorCache(cachePath, signature, donors):
+    try:
+        with open(cachePath, "wb") as f:
+            pickle.dump({"signature": signature, "donors": donors}, f, protocol=5)
+    except OSError:
+        pass
+
+
+# fetches a column value by position, tolerating short rows and missing columns
+def _field(row, index):
+    if index is None or index >= len(row):
+        return ""
+    return row[index]
+
+
 # reads donor data from CSV file
 def readDonorData(filename):
     donors = []
 
     try:
+        # reuse the parsed donors from the last run if the CSV is unchanged
+        cachePath = filename + ".cache.pkl"
+        signature = _cacheSignature(filename)
+        cached = _loadDonorCache(cachePath, signature)
+        if cached is not None:
+            print(f"Loaded {len(cached)} donors from cache for {filename}")
+            return cached
+
         with open(filename, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
+            reader = csv.reader(file)
+
+            # resolve column positions once from the header so each row is
+            # plain list indexing instead of a per-row dict build
+            header = next(reader, None)
+            if header is None:
+                print(f"Error: empty donor file: {filename}")
+                return donors
+
+            columnIdx = {name: i for i, name in enumerate(header)}
+            nameIdx = columnIdx.get("Name")
+            fbwmIdx = columnIdx.get("FBWM")
+            textIdx = [(columnIdx.get(col), attr) for col, attr in _TEXT_FIELDS]
+            floatIdx = [(columnIdx.get(col), attr) for col, attr in _FLOAT_FIELDS]
 
             for row in reader:
                 # skip empty rows
-                if not row.get("Name") or not row["Name"].strip():
+                name = _field(row, nameIdx).strip()
+                if not name:
                     continue
 
-                name = row["Name"].strip()
-
                 # check if donor has '*' in name (legacy format) or FBWM column
+                fbwmValue = _field(row, fbwmIdx)
                 if "*" in name:
                     fbwmPartner = True
                     name = name.replace("*", "").strip()
-                elif row.get("FBWM"):
-                    fbwmStr = row["FBWM"].strip().upper()
+                elif fbwmValue:
+                    fbwmStr = fbwmValue.strip().upper()
                     fbwmPartner = fbwmStr in ["Y", "YES", "TRUE", "1"]
                 else:
                     fbwmPartner = False
@@ -52,77 +130,24 @@ def readDonorData(filename):
                 donor = Donor(name, fbwmPartner)
 
                 # populate location data
-                if row.get("Address"):
-                    donor.address = row["Address"].strip()
-
-                if row.get("City"):
-                    donor.city = row["City"].strip()
-
-                if row.get("State"):
-                    donor.state = row["State"].strip()
-
-                if row.get("Zip"):
-                    donor.zip = row["Zip"].strip()
-
-                # populate coordinates
-                if row.get("Latitude"):
-                    try:
-                        donor.latitude = float(row["Latitude"])
-                    except (ValueError, TypeError):
-                        donor.latitude = None
-
-                if row.get("Longitude"):
-                    try:
-                        donor.longitude = float(row["Longitude"])
-                    except (ValueError, TypeError):
-                        donor.longitude = None
-
-                # populate food type percentages
-                if row.get("Bread%"):
-                    try:
-                        donor.breadPercent = float(row["Bread%"])
-                    except (ValueError, TypeError):
-                        donor.breadPercent = None
-
-                if row.get("Dairy%"):
-                    try:
-                        donor.dairyPercent = float(row["Dairy%"])
-                    except (ValueError, TypeError):
-                        donor.dairyPercent = None
-
-                if row.get("Prepared%"):
-                    try:
-                        donor.preparedPercent = float(row["Prepared%"])
-                    except (ValueError, TypeError):
-                        donor.preparedPercent = None
-
-                if row.get("Non-Perishable%"):
-                    try:
-                        donor.nonPerishablePercent = float(row["Non-Perishable%"])
-                    except (ValueError, TypeError):
-                        donor.nonPerishablePercent = None
-
-                if row.get("Produce%"):
-                    try:
-                        donor.producePercent = float(row["Produce%"])
-                    except (ValueError, TypeError):
-                        donor.producePercent = None
-
-                if row.get("Protein%"):
-                    try:
-                        donor.proteinPercent = float(row["Protein%"])
-                    except (ValueError, TypeError):
-                        donor.proteinPercent = None
-
-                if row.get("Hygiene%"):
-                    try:
-                        donor.hygienePercent = float(row["Hygiene%"])
-                    except (ValueError, TypeError):
-                        donor.hygienePercent = None
+                for index, attr in textIdx:
+                    value = _field(row, index).strip()
+                    if value:
+                        setattr(donor, attr, value)
+
+                # populate coordinates and food type percentages
+                for index, attr in floatIdx:
+                    value = _field(row, index)
+                    if value:
+                        try:
+                            setattr(donor, attr, float(value))
+                        except (ValueError, TypeError):
+                            pass  # attribute stays None
 
                 donors.append(donor)
 
         print(f"Successfully loaded {len(donors)} donors from {filename}")
+        _saveDonorCache(cachePath, signature, donors)
         return donors
 
     except FileNotFoundError:
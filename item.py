@@ -1,4 +1,16 @@
 class Item:
+    # slots keep the thousands of generated items small and off the
+    # per-instance dict path
+    __slots__ = (
+        "donor",
+        "timestep",
+        "weight",
+        "foodType",
+        "availabilityTime",
+        "probability",
+        "foodTypeQuantities",
+    )
+
     def __init__(self, donor, timestep, weight, foodType):
         self.donor = donor  # object from the class donor, corresponding to the donor that donated the item
         self.timestep = timestep
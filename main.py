@@ -1,26 +1,55 @@
+import argparse
 import os
 import sys
 import csv
+import logging
 import random
 import numpy as np
-from colorama import Fore
 
 from item import Item
 from donor import readDonorData
-from agency import Agency, Preference, readAgencyData
+from agency import Agency, Preference, readAgencyData, readAgencyDataXlsx
 from driver import Driver, generateDrivers
-from visuals import plotBipartiteGraph, plotAllocationGraph, plotComparisonGraphs
+from visuals import (
+    createAllocationMatrix,
+    plotBipartiteGraph,
+    plotAllocationGraph,
+    plotComparisonGraphs,
+)
 from algos import egalitarianILP, printAllocationSummary, randItemGen
 
 seed = 3
 
 random.seed(seed)
 
+# progress output from algos goes through logging; LOGLEVEL=WARNING
+# silences it for benchmark runs without touching the code
+logging.basicConfig(
+    level=os.environ.get("LOGLEVEL", "INFO"), format="%(message)s"
+)
+
 
 def main():
 
+    # the CSV and workbook pipelines share everything but the agency
+    # reader, so the choice is a flag rather than a separate script
+    parser = argparse.ArgumentParser(description="Run the fair food allocation")
+    parser.add_argument(
+        "--agency-source",
+        choices=["csv", "xlsx"],
+        default="csv",
+        help="read agencies from the legacy CSV or the current workbooks",
+    )
+    args = parser.parse_args()
+
     # read in agency data
-    agencies = readAgencyData("resources/agencyData.csv")
+    if args.agency_source == "xlsx":
+        agencies = readAgencyDataXlsx(
+            "resources/CURRENT_AgencyList8-2025.xlsx",
+            "resources/FoodEquityPoundsFoodTypeSummary2023Statistics.xlsx",
+        )
+    else:
+        agencies = readAgencyData("resources/agencyData.csv")
     # read in donor data
     donors = readDonorData("resources/donorData.csv")
     # generate time steps
@@ -29,33 +58,36 @@ def main():
     # generate drivers for the new formulation
     drivers = generateDrivers(5)  # create 5 drivers with random locations
 
-    # populate adjacency matrix connecting agencies to donors if feasible
-    adjMatrix = np.zeros((len(donors), len(agencies)))
-
-    # set array of donor names
-    donorLabels = []
-    for i in range(len(donors)):
-        donorLabels.append(donors[i].name)
-
-    # set array of agency names
-    agencyLabels = []
-    for i in range(len(agencies)):
-        agencyLabels.append(agencies[i].name)
-
-    # populate adjacency matrix with edges
-    for i in range(len(donors)):
-        for j in range(len(agencies)):
-
-            # if donor is FBWM partner and agency is not, no connection
-            if donors[i].fbwmPartner == True and agencies[j].fbwmPartner == "NFB":
-                continue
+    # set arrays of donor and agency names
+    donorLabels = [donor.name for donor in donors]
+    agencyLabels = [agency.name for agency in agencies]
+
+    # populate adjacency matrix connecting agencies to donors if feasible,
+    # in one vectorized pass instead of a Python loop per pair
+
+    # if donor is FBWM partner and agency is not, no connection. agency
+    # fbwmPartner is False for non-partners ("NFB" in the source data) and
+    # a truthy partnership code otherwise, so compare truthiness rather
+    # than the raw "NFB" string, which never survives parsing
+    fbwmDonors = np.fromiter(
+        (bool(donor.fbwmPartner) for donor in donors),
+        dtype=bool,
+        count=len(donors),
+    )
+    nfbAgencies = np.fromiter(
+        (not agency.fbwmPartner for agency in agencies),
+        dtype=bool,
+        count=len(agencies),
+    )
+    forbidden = fbwmDonors[:, None] & nfbAgencies[None, :]
 
-            # TODO populate the adjacency matrix based the lat/long of donors and agencies
-            # ! Still need lat/long data for donors
+    # TODO populate the adjacency matrix based the lat/long of donors and agencies
+    # ! Still need lat/long data for donors
 
-            # TEMPORARY randomly generate edges
-            elif random.random() < 1.00:  # 7% chance of a connection
-                adjMatrix[i][j] = 1
+    # TEMPORARY randomly generate edges
+    rng = np.random.default_rng(seed)
+    randomEdges = rng.random((len(donors), len(agencies))) < 1.00  # 7% chance of a connection
+    adjMatrix = (randomEdges & ~forbidden).astype(np.int8)
 
     print(f"\nAdjacency Matrix Shape: {adjMatrix.shape}")
     print(f"Possible connections: {int(np.sum(adjMatrix))}")
@@ -81,10 +113,18 @@ def main():
     # printAllocationSummary(allocation, items, agencies, donors, agencyUtilities)
     printAllocationSummary(allocation, agencies, items, donors, agencyUtilities)
 
-    # visualize
+    # visualize; build the allocation matrix once so every plot of this
+    # allocation shares it instead of re-walking the dict
+    allocationMatrix = createAllocationMatrix(allocation, len(donors), len(agencies))
     print("\nDisplaying network comparison...")
     plotComparisonGraphs(
-        adjMatrix, allocation, donors, agencies, donorLabels, agencyLabels
+        adjMatrix,
+        allocation,
+        donors,
+        agencies,
+        donorLabels,
+        agencyLabels,
+        allocationMatrix=allocationMatrix,
     )
 
     return 0
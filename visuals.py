@@ -1,8 +1,23 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import networkx as nx
 import time
 
+# matplotlib and networkx are imported lazily inside the plotting functions
+# so scripts that never plot don't pay their import cost
+
+# above these sizes a node-and-edge drawing is illegible and slow to
+# render, so the plots fall back to a heatmap of the matrix instead
+_MAX_PLOT_CELLS = 5000
+_MAX_PLOT_EDGES = 2000
+
+# past this many nodes the per-node text artists overlap into noise and
+# their font layout dominates render time, so labels are skipped
+_MAX_LABELED_NODES = 60
+
+
+# returns True when the network is small enough to draw node-by-node
+def _drawableAsNetwork(numDonors, numAgencies, numEdges):
+    return numDonors * numAgencies <= _MAX_PLOT_CELLS and numEdges <= _MAX_PLOT_EDGES
+
 
 # takes an m x n adjacency matrix and visualizes it as a bipartite graph
 def plotBipartiteGraph(
@@ -14,8 +29,12 @@ def plotBipartiteGraph(
     # agencyLabels: list of labels for food recipient agencies (optional)
     # figureSize: tuple specifying the figure size (width, height)
 
-    # convert to numpy array for easier handling
-    adjMatrix = np.array(adjacencyMatrix)
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    # convert to numpy array for easier handling; asarray is a no-op for
+    # callers that already pass an ndarray, avoiding a full copy
+    adjMatrix = np.asarray(adjacencyMatrix)
     numDonors, numAgencies = adjMatrix.shape
 
     # create default labels if none provided
@@ -24,97 +43,113 @@ def plotBipartiteGraph(
     if agencyLabels is None:
         agencyLabels = [f"Agency_{i+1}" for i in range(numAgencies)]
 
-    # create bipartite graph
-    bipartiteGraph = nx.Graph()
-
-    # add donor nodes (left side)
-    donorNodes = [f"D_{i}" for i in range(numDonors)]
-    bipartiteGraph.add_nodes_from(donorNodes, bipartite=0)
-
-    # add agency nodes (right side)
-    agencyNodes = [f"A_{i}" for i in range(numAgencies)]
-    bipartiteGraph.add_nodes_from(agencyNodes, bipartite=1)
-
-    # add edges based on adjacency matrix
-    for donorIdx in range(numDonors):
-        for agencyIdx in range(numAgencies):
-            if adjMatrix[donorIdx][agencyIdx] == 1:
-                bipartiteGraph.add_edge(f"D_{donorIdx}", f"A_{agencyIdx}")
-
-    # create layout for bipartite graph
-    donorPositions = {f"D_{i}": (0, i) for i in range(numDonors)}
-    agencyPositions = {f"A_{i}": (2, i) for i in range(numAgencies)}
-    nodePositions = {**donorPositions, **agencyPositions}
-
-    # create the plot
-    plt.figure(figsize=figureSize)
-
-    # draw donor nodes (left side)
-    nx.draw_networkx_nodes(
-        bipartiteGraph,
-        nodePositions,
-        nodelist=donorNodes,
-        node_color="lightblue",
-        node_size=1000,
-        alpha=0.8,
-    )
-
-    # draw agency nodes (right side)
-    nx.draw_networkx_nodes(
-        bipartiteGraph,
-        nodePositions,
-        nodelist=agencyNodes,
-        node_color="lightcoral",
-        node_size=1000,
-        alpha=0.8,
-    )
-
-    # draw edges
-    nx.draw_networkx_edges(
-        bipartiteGraph, nodePositions, edge_color="gray", width=2, alpha=0.6
-    )
+    # positions are just two columns (donors at x=0, agencies at x=2), so
+    # draw directly with matplotlib instead of building a networkx graph
+    # and paying its node/edge/label draw passes
+    fig = plt.figure(figsize=figureSize)
+    ax = plt.gca()
+
+    edgeRows, edgeCols = np.nonzero(adjMatrix)
+
+    if not _drawableAsNetwork(numDonors, numAgencies, len(edgeRows)):
+        # too big for a legible node-and-edge drawing; show the adjacency
+        # matrix itself as a single image artist instead
+        ax.imshow(adjMatrix, aspect="auto", cmap="Greys", interpolation="nearest")
+        ax.set_xlabel("Recieving Agencies")
+        ax.set_ylabel("Food Donors")
+        plt.title(
+            "Donor-Agency Adjacency Matrix",
+            fontsize=16,
+            fontweight="bold",
+            pad=20,
+        )
+    else:
+        # all edges as one LineCollection from the nonzero entries
+        ax.add_collection(
+            LineCollection(
+                _edgeSegments(edgeRows, edgeCols, xRight=2.0),
+                colors="gray",
+                linewidths=2,
+                alpha=0.6,
+            )
+        )
 
-    # create labels for display
-    displayLabels = {}
-    for i, donorNode in enumerate(donorNodes):
-        displayLabels[donorNode] = donorLabels[i]
-    for i, agencyNode in enumerate(agencyNodes):
-        displayLabels[agencyNode] = agencyLabels[i]
+        # donor nodes (left side) and agency nodes (right side)
+        ax.scatter(
+            np.zeros(numDonors),
+            np.arange(numDonors),
+            c="lightblue",
+            s=1000,
+            alpha=0.8,
+            zorder=3,
+        )
+        ax.scatter(
+            np.full(numAgencies, 2),
+            np.arange(numAgencies),
+            c="lightcoral",
+            s=1000,
+            alpha=0.8,
+            zorder=3,
+        )
 
-    # draw labels
-    nx.draw_networkx_labels(
-        bipartiteGraph,
-        nodePositions,
-        labels=displayLabels,
-        font_size=10,
-        font_weight="bold",
-    )
+        # node labels, only while there are few enough to stay readable
+        if numDonors + numAgencies <= _MAX_LABELED_NODES:
+            for i in range(numDonors):
+                ax.annotate(
+                    donorLabels[i],
+                    (0, i),
+                    fontsize=10,
+                    fontweight="bold",
+                    ha="center",
+                    va="center",
+                    zorder=4,
+                )
+            for i in range(numAgencies):
+                ax.annotate(
+                    agencyLabels[i],
+                    (2, i),
+                    fontsize=10,
+                    fontweight="bold",
+                    ha="center",
+                    va="center",
+                    zorder=4,
+                )
+
+        ax.set_xlim(-0.5, 2.5)
+        ax.set_ylim(-1, max(numDonors, numAgencies) + 1)
+
+        # customize the plot
+        plt.title(
+            "Bipartite Graph of Donors to Agencies",
+            fontsize=16,
+            fontweight="bold",
+            pad=20,
+        )
+        plt.text(
+            0,
+            max(numDonors, numAgencies) + 0.5,
+            "Food Donors",
+            fontsize=14,
+            fontweight="bold",
+            ha="center",
+        )
+        plt.text(
+            2,
+            max(numDonors, numAgencies) + 0.5,
+            "Recieving Agencies",
+            fontsize=14,
+            fontweight="bold",
+            ha="center",
+        )
 
-    # customize the plot
-    plt.title(
-        "Bipartite Graph of Donors to Agencies", fontsize=16, fontweight="bold", pad=20
-    )
-    plt.text(
-        0,
-        max(numDonors, numAgencies) + 0.5,
-        "Food Donors",
-        fontsize=14,
-        fontweight="bold",
-        ha="center",
-    )
-    plt.text(
-        2,
-        max(numDonors, numAgencies) + 0.5,
-        "Recieving Agencies",
-        fontsize=14,
-        fontweight="bold",
-        ha="center",
-    )
+        # remove axes
+        plt.axis("off")
 
-    # remove axes
-    plt.axis("off")
     plt.tight_layout()
     plt.show()
+    # release the figure so repeated plotting (e.g. parameter sweeps)
+    # doesn't accumulate artists in pyplot's figure registry
+    plt.close(fig)
 
     # print summary statistics
     totalConnections = np.sum(adjMatrix)
@@ -125,6 +160,17 @@ def plotBipartiteGraph(
     print(f"Connection Density: {totalConnections / (numDonors * numAgencies):.2%}")
 
 
+# packs (0, row) -> (1, col) line segments for a LineCollection so a
+# whole edge set renders as one artist instead of one Line2D per edge
+def _edgeSegments(rows, cols, xRight=1.0):
+    segments = np.empty((len(rows), 2, 2), dtype=np.float64)
+    segments[:, 0, 0] = 0
+    segments[:, 0, 1] = rows
+    segments[:, 1, 0] = xRight
+    segments[:, 1, 1] = cols
+    return segments
+
+
 # creates adjacency matrix showing only edges used in allocation
 def createAllocationMatrix(allocation, numDonors, numAgencies):
     """
@@ -138,11 +184,21 @@ def createAllocationMatrix(allocation, numDonors, numAgencies):
     returns: numpy array representing used connections
     """
 
-    allocationMatrix = np.zeros((numDonors, numAgencies))
-
-    for agencyIdx, allocatedItems in allocation.items():
-        for donorIdx, itemIdx in allocatedItems:
-            allocationMatrix[donorIdx][agencyIdx] = 1
+    # uint8 is plenty for a 0/1 matrix and an eighth of float64's traffic
+    allocationMatrix = np.zeros((numDonors, numAgencies), dtype=np.uint8)
+
+    # flatten the dict-of-lists into index arrays and stamp all the 1s
+    # with one fancy-index assignment instead of a Python store per edge
+    donorIdx = [
+        donor for allocatedItems in allocation.values() for donor, _ in allocatedItems
+    ]
+    agencyIdx = [
+        agency
+        for agency, allocatedItems in allocation.items()
+        for _ in allocatedItems
+    ]
+    if donorIdx:
+        allocationMatrix[donorIdx, agencyIdx] = 1
 
     return allocationMatrix
 
@@ -155,6 +211,7 @@ def plotAllocationGraph(
     donorLabels=None,
     agencyLabels=None,
     figureSize=(15, 11),
+    allocationMatrix=None,
 ):
     """
     visualizes the bipartite graph showing only the donor-agency connections
@@ -166,10 +223,18 @@ def plotAllocationGraph(
     donorLabels: optional list of donor labels
     agencyLabels: optional list of agency labels
     figureSize: tuple specifying figure size
+    allocationMatrix: optional precomputed matrix from createAllocationMatrix,
+        so callers plotting the same allocation twice build it once
     """
 
-    # create allocation matrix
-    allocationMatrix = createAllocationMatrix(allocation, len(donors), len(agencies))
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
+    # create allocation matrix unless the caller already has one
+    if allocationMatrix is None:
+        allocationMatrix = createAllocationMatrix(
+            allocation, len(donors), len(agencies)
+        )
 
     # use existing labels or create defaults
     if donorLabels is None:
@@ -189,13 +254,13 @@ def plotAllocationGraph(
     agencyNodes = [f"A_{i}" for i in range(numAgencies)]
     bipartiteGraph.add_nodes_from(agencyNodes, bipartite=1)
 
-    # add edges based on allocation matrix
-    usedEdges = []
-    for donorIdx in range(numDonors):
-        for agencyIdx in range(numAgencies):
-            if allocationMatrix[donorIdx][agencyIdx] == 1:
-                bipartiteGraph.add_edge(f"D_{donorIdx}", f"A_{agencyIdx}")
-                usedEdges.append((f"D_{donorIdx}", f"A_{agencyIdx}"))
+    # add edges from the nonzero entries of the allocation matrix
+    usedRows, usedCols = np.nonzero(allocationMatrix)
+    usedEdges = [
+        (f"D_{donorIdx}", f"A_{agencyIdx}")
+        for donorIdx, agencyIdx in zip(usedRows, usedCols)
+    ]
+    bipartiteGraph.add_edges_from(usedEdges)
 
     # create layout for bipartite graph
     donorPositions = {f"D_{i}": (0, i) for i in range(numDonors)}
@@ -203,7 +268,7 @@ def plotAllocationGraph(
     nodePositions = {**donorPositions, **agencyPositions}
 
     # create the plot
-    plt.figure(figsize=figureSize)
+    fig = plt.figure(figsize=figureSize)
 
     # draw all donor nodes (including those not used)
     nx.draw_networkx_nodes(
@@ -236,21 +301,19 @@ def plotAllocationGraph(
             alpha=0.8,
         )
 
-    # create labels for display
-    displayLabels = {}
-    for i, donorNode in enumerate(donorNodes):
-        displayLabels[donorNode] = donorLabels[i]
-    for i, agencyNode in enumerate(agencyNodes):
-        displayLabels[agencyNode] = agencyLabels[i]
+    # draw labels, only while there are few enough to stay readable;
+    # zip pairs the parallel lists without an index loop
+    if numDonors + numAgencies <= _MAX_LABELED_NODES:
+        displayLabels = dict(zip(donorNodes, donorLabels))
+        displayLabels.update(zip(agencyNodes, agencyLabels))
 
-    # draw labels
-    nx.draw_networkx_labels(
-        bipartiteGraph,
-        nodePositions,
-        labels=displayLabels,
-        font_size=8,
-        font_weight="bold",
-    )
+        nx.draw_networkx_labels(
+            bipartiteGraph,
+            nodePositions,
+            labels=displayLabels,
+            font_size=8,
+            font_weight="bold",
+        )
 
     # customize the plot
     plt.title(
@@ -286,11 +349,14 @@ def plotAllocationGraph(
     plt.axis("off")
     plt.tight_layout()
     plt.show()
+    plt.close(fig)
 
-    # print allocation summary statistics
-    totalTransfers = np.sum(allocationMatrix)
-    donorsUsed = np.sum(np.any(allocationMatrix, axis=1))
-    agenciesServed = np.sum(np.any(allocationMatrix, axis=0))
+    # print allocation summary statistics; the nonzero rows/cols computed
+    # for the edge list already hold everything, so no further passes over
+    # the matrix are needed
+    totalTransfers = len(usedRows)
+    donorsUsed = len(np.unique(usedRows))
+    agenciesServed = len(np.unique(usedCols))
 
     print(f"\nAllocation Graph Summary:")
     print(f"Total Donor-Agency Transfers: {int(totalTransfers)}")
@@ -309,6 +375,7 @@ def plotComparisonGraphs(
     donorLabels=None,
     agencyLabels=None,
     figureSize=(20, 10),
+    allocationMatrix=None,
 ):
     """
     creates side-by-side comparison of full donor-agency network vs actual allocation
@@ -320,10 +387,18 @@ def plotComparisonGraphs(
     donorLabels: optional list of donor labels
     agencyLabels: optional list of agency labels
     figureSize: tuple specifying figure size
+    allocationMatrix: optional precomputed matrix from createAllocationMatrix,
+        so callers plotting the same allocation twice build it once
     """
 
-    # create allocation matrix
-    allocationMatrix = createAllocationMatrix(allocation, len(donors), len(agencies))
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    # create allocation matrix unless the caller already has one
+    if allocationMatrix is None:
+        allocationMatrix = createAllocationMatrix(
+            allocation, len(donors), len(agencies)
+        )
 
     # use existing labels or create defaults
     if donorLabels is None:
@@ -334,48 +409,89 @@ def plotComparisonGraphs(
     # create figure with subplots
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figureSize)
 
-    # plot 1: full network
     numDonors, numAgencies = fullAdjMatrix.shape
+    fullRows, fullCols = np.nonzero(fullAdjMatrix)
+
+    if not _drawableAsNetwork(numDonors, numAgencies, len(fullRows)):
+        # too big for legible node-and-edge panels; show both matrices as
+        # heatmaps, one image artist each
+        ax1.imshow(fullAdjMatrix, aspect="auto", cmap="Greys", interpolation="nearest")
+        ax1.set_title(
+            "Full Donor-Agency Network\n(All Possible Connections)",
+            fontsize=12,
+            fontweight="bold",
+        )
+        ax1.set_xlabel("Agencies")
+        ax1.set_ylabel("Donors")
 
-    for i in range(numDonors):
-        for j in range(numAgencies):
-            if fullAdjMatrix[i][j] == 1:
-                ax1.plot([0, 1], [i, j], "gray", alpha=0.2, linewidth=0.5)
+        ax2.imshow(
+            allocationMatrix, aspect="auto", cmap="Greens", interpolation="nearest"
+        )
+        ax2.set_title(
+            "Allocation Results\n(Actual Food Transfers)",
+            fontsize=12,
+            fontweight="bold",
+        )
+        ax2.set_xlabel("Agencies")
+        ax2.set_ylabel("Donors")
+    else:
+        # plot 1: full network; all edges go down as one LineCollection
+        # instead of one ax.plot call (and one Line2D artist) per edge
+        ax1.add_collection(
+            LineCollection(
+                _edgeSegments(fullRows, fullCols),
+                colors="gray",
+                alpha=0.2,
+                linewidths=0.5,
+            )
+        )
 
-    ax1.scatter([0] * numDonors, range(numDonors), c="lightblue", s=80, zorder=3)
-    ax1.scatter([1] * numAgencies, range(numAgencies), c="lightcoral", s=80, zorder=3)
+        ax1.scatter([0] * numDonors, range(numDonors), c="lightblue", s=80, zorder=3)
+        ax1.scatter(
+            [1] * numAgencies, range(numAgencies), c="lightcoral", s=80, zorder=3
+        )
 
-    ax1.set_xlim(-0.1, 1.1)
-    ax1.set_ylim(-1, max(numDonors, numAgencies))
-    ax1.set_title(
-        "Full Donor-Agency Network\n(All Possible Connections)",
-        fontsize=12,
-        fontweight="bold",
-    )
-    ax1.text(0, -0.5, "Donors", ha="center", fontsize=10, fontweight="bold")
-    ax1.text(1, -0.5, "Agencies", ha="center", fontsize=10, fontweight="bold")
-    ax1.axis("off")
-
-    # plot 2: allocation results
-    for i in range(numDonors):
-        for j in range(numAgencies):
-            if allocationMatrix[i][j] == 1:
-                ax2.plot([0, 1], [i, j], "green", alpha=0.8, linewidth=2)
-
-    ax2.scatter([0] * numDonors, range(numDonors), c="lightblue", s=80, zorder=3)
-    ax2.scatter([1] * numAgencies, range(numAgencies), c="lightcoral", s=80, zorder=3)
-
-    ax2.set_xlim(-0.1, 1.1)
-    ax2.set_ylim(-1, max(numDonors, numAgencies))
-    ax2.set_title(
-        "Allocation Results\n(Actual Food Transfers)", fontsize=12, fontweight="bold"
-    )
-    ax2.text(0, -0.5, "Donors", ha="center", fontsize=10, fontweight="bold")
-    ax2.text(1, -0.5, "Agencies", ha="center", fontsize=10, fontweight="bold")
-    ax2.axis("off")
+        ax1.set_xlim(-0.1, 1.1)
+        ax1.set_ylim(-1, max(numDonors, numAgencies))
+        ax1.set_title(
+            "Full Donor-Agency Network\n(All Possible Connections)",
+            fontsize=12,
+            fontweight="bold",
+        )
+        ax1.text(0, -0.5, "Donors", ha="center", fontsize=10, fontweight="bold")
+        ax1.text(1, -0.5, "Agencies", ha="center", fontsize=10, fontweight="bold")
+        ax1.axis("off")
+
+        # plot 2: allocation results, likewise as a single collection
+        usedRows, usedCols = np.nonzero(allocationMatrix)
+        ax2.add_collection(
+            LineCollection(
+                _edgeSegments(usedRows, usedCols),
+                colors="green",
+                alpha=0.8,
+                linewidths=2,
+            )
+        )
+
+        ax2.scatter([0] * numDonors, range(numDonors), c="lightblue", s=80, zorder=3)
+        ax2.scatter(
+            [1] * numAgencies, range(numAgencies), c="lightcoral", s=80, zorder=3
+        )
+
+        ax2.set_xlim(-0.1, 1.1)
+        ax2.set_ylim(-1, max(numDonors, numAgencies))
+        ax2.set_title(
+            "Allocation Results\n(Actual Food Transfers)",
+            fontsize=12,
+            fontweight="bold",
+        )
+        ax2.text(0, -0.5, "Donors", ha="center", fontsize=10, fontweight="bold")
+        ax2.text(1, -0.5, "Agencies", ha="center", fontsize=10, fontweight="bold")
+        ax2.axis("off")
 
     plt.tight_layout()
     plt.show()
+    plt.close(fig)
 
     # print comparison statistics
     totalPossible = np.sum(fullAdjMatrix)